@@ -1,8 +1,14 @@
 """API request and response models."""
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+# Single shared config so every model reuses one ConfigDict instance
+# instead of each class building its own defaults. defer_build skips
+# core-schema construction until first use; FastAPI triggers the build
+# once at startup for models referenced by routes.
+_MODEL_CONFIG = ConfigDict(defer_build=True)
+
 
 # ============================================================================
 # Campaign Models
@@ -13,15 +19,47 @@ class CreateCampaignRequest(BaseModel):
 
     config_path: str = Field(
         ...,
-        description="Path to campaign YAML configuration file",
-        example="configs/example_campaign.yaml"
+        description="Path to campaign YAML configuration file"
     )
     start_time: Optional[datetime] = Field(
         None,
-        description="Campaign start time in GMT+8 (Singapore time). If future, campaign will be created as PAUSED and auto-scheduled. If None or past, campaign stays PAUSED until manually activated.",
-        example="2026-01-03T20:00:00"
+        description="Campaign start time in GMT+8 (Singapore time). If future, campaign will be created as PAUSED and auto-scheduled. If None or past, campaign stays PAUSED until manually activated."
     )
 
+    model_config = {
+        **_MODEL_CONFIG,
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "config_path": "configs/example_campaign.yaml",
+                    "start_time": "2026-01-03T20:00:00"
+                }
+            ]
+        }
+    }
+
+
+class MetaIds(BaseModel):
+    """Meta platform IDs created for a campaign."""
+
+    campaign_id: str = Field(..., description="Meta campaign ID")
+    adset_id: str = Field(..., description="Meta ad set ID")
+    ad_id: str = Field(..., description="Meta ad ID")
+    creative_id: str = Field(..., description="Meta creative ID")
+    video_id: str = Field(..., description="Meta video ID")
+
+    model_config = _MODEL_CONFIG
+
+
+class ScheduledActivation(BaseModel):
+    """Auto-scheduling details attached to a campaign response."""
+
+    job_id: str = Field(..., description="Scheduler job ID")
+    scheduled_time: datetime = Field(..., description="Scheduled activation time (GMT+8)")
+    status: str = Field(..., description="Job status (pending)")
+
+    model_config = _MODEL_CONFIG
+
 
 class CampaignResponse(BaseModel):
     """Campaign creation response."""
@@ -30,32 +68,19 @@ class CampaignResponse(BaseModel):
     status: str = Field(..., description="Campaign status (PAUSED, ACTIVE, etc.)")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    meta_ids: Dict[str, str] = Field(
-        ...,
-        description="Meta platform IDs",
-        example={
-            "campaign_id": "123456789",
-            "adset_id": "987654321",
-            "ad_id": "456789123",
-            "creative_id": "789123456",
-            "video_id": "321654987"
-        }
-    )
+    meta_ids: MetaIds = Field(..., description="Meta platform IDs")
 
     account_id: str = Field(..., description="Ad account ID (act_xxx)")
     campaign_name: str = Field(..., description="Campaign name")
 
     # Optional scheduling info
-    scheduled_activation: Optional[Dict[str, Any]] = Field(
+    scheduled_activation: Optional[ScheduledActivation] = Field(
         None,
-        description="Scheduling details if campaign was auto-scheduled",
-        example={
-            "job_id": "activate_campaign_abc123",
-            "scheduled_time": "2026-01-03T20:00:00",
-            "status": "pending"
-        }
+        description="Scheduling details if campaign was auto-scheduled"
     )
 
+    model_config = _MODEL_CONFIG
+
 
 class CampaignStatusResponse(BaseModel):
     """Campaign status response (synced from Meta)."""
@@ -68,6 +93,8 @@ class CampaignStatusResponse(BaseModel):
     updated_time: Optional[str] = Field(None, description="Last update time from Meta")
     last_synced: datetime = Field(..., description="Last sync timestamp")
 
+    model_config = _MODEL_CONFIG
+
 
 class SyncCampaignResponse(BaseModel):
     """Campaign sync response."""
@@ -76,6 +103,8 @@ class SyncCampaignResponse(BaseModel):
     campaign_id: str = Field(..., description="Internal campaign ID")
     changes: Dict[str, Any] = Field(..., description="Fields that were updated")
 
+    model_config = _MODEL_CONFIG
+
 
 class ActivateCampaignResponse(BaseModel):
     """Campaign activation response."""
@@ -85,6 +114,8 @@ class ActivateCampaignResponse(BaseModel):
     status: str = Field(..., description="New status (should be ACTIVE)")
     activated_at: datetime = Field(..., description="Activation timestamp")
 
+    model_config = _MODEL_CONFIG
+
 
 # ============================================================================
 # Scheduling Models
@@ -95,10 +126,16 @@ class ScheduleRequest(BaseModel):
 
     activate_at: datetime = Field(
         ...,
-        description="Activation time in GMT+8 (Singapore time)",
-        example="2024-03-15T08:00:00"
+        description="Activation time in GMT+8 (Singapore time)"
     )
 
+    model_config = {
+        **_MODEL_CONFIG,
+        "json_schema_extra": {
+            "examples": [{"activate_at": "2024-03-15T08:00:00"}]
+        }
+    }
+
 
 class ScheduleResponse(BaseModel):
     """Schedule creation response."""
@@ -109,6 +146,8 @@ class ScheduleResponse(BaseModel):
     status: str = Field(..., description="Job status (scheduled)")
     created_at: datetime = Field(..., description="Schedule creation timestamp")
 
+    model_config = _MODEL_CONFIG
+
 
 class CancelScheduleResponse(BaseModel):
     """Schedule cancellation response."""
@@ -117,6 +156,8 @@ class CancelScheduleResponse(BaseModel):
     campaign_id: str = Field(..., description="Internal campaign ID")
     job_id: str = Field(..., description="Scheduler job ID that was cancelled")
 
+    model_config = _MODEL_CONFIG
+
 
 class ScheduleStatusResponse(BaseModel):
     """Schedule status response."""
@@ -129,6 +170,8 @@ class ScheduleStatusResponse(BaseModel):
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp if job ran")
     error: Optional[str] = Field(None, description="Error message if job failed")
 
+    model_config = _MODEL_CONFIG
+
 
 # ============================================================================
 # Account Models
@@ -137,46 +180,32 @@ class ScheduleStatusResponse(BaseModel):
 class CreateAccountRequest(BaseModel):
     """Request to add a new client account."""
 
-    account_id: str = Field(
-        ...,
-        description="Internal account ID (slug)",
-        example="acct_client_a"
-    )
-    meta_account_id: str = Field(
-        ...,
-        description="Meta ad account ID (with act_ prefix)",
-        example="act_123456789"
-    )
-    client_name: str = Field(
-        ...,
-        description="Client display name",
-        example="Client A"
-    )
-    currency: str = Field(
-        ...,
-        description="Account currency (SGD, USD, MYR, etc.)",
-        example="SGD"
-    )
-    pixel_id: str = Field(
-        ...,
-        description="Meta Pixel ID",
-        example="123456789012345"
-    )
-    page_id: str = Field(
-        ...,
-        description="Facebook Page ID",
-        example="987654321098765"
-    )
-    catalog_id: Optional[str] = Field(
-        None,
-        description="Product catalog ID (optional)",
-        example="456789123456789"
-    )
-    domain: Optional[str] = Field(
-        None,
-        description="Client domain (optional)",
-        example="client-website.com"
-    )
+    account_id: str = Field(..., description="Internal account ID (slug)")
+    meta_account_id: str = Field(..., description="Meta ad account ID (with act_ prefix)")
+    client_name: str = Field(..., description="Client display name")
+    currency: str = Field(..., description="Account currency (SGD, USD, MYR, etc.)")
+    pixel_id: str = Field(..., description="Meta Pixel ID")
+    page_id: str = Field(..., description="Facebook Page ID")
+    catalog_id: Optional[str] = Field(None, description="Product catalog ID (optional)")
+    domain: Optional[str] = Field(None, description="Client domain (optional)")
+
+    model_config = {
+        **_MODEL_CONFIG,
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "account_id": "acct_client_a",
+                    "meta_account_id": "act_123456789",
+                    "client_name": "Client A",
+                    "currency": "SGD",
+                    "pixel_id": "123456789012345",
+                    "page_id": "987654321098765",
+                    "catalog_id": "456789123456789",
+                    "domain": "client-website.com"
+                }
+            ]
+        }
+    }
 
 
 class AccountResponse(BaseModel):
@@ -191,6 +220,8 @@ class AccountResponse(BaseModel):
     catalog_id: Optional[str] = Field(None, description="Product catalog ID")
     domain: Optional[str] = Field(None, description="Client domain")
 
+    model_config = _MODEL_CONFIG
+
 
 # ============================================================================
 # Error Models
@@ -202,3 +233,5 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
+
+    model_config = _MODEL_CONFIG
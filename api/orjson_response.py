@@ -0,0 +1,27 @@
+"""orjson-backed JSON response class for FastAPI."""
+import orjson
+from typing import Any
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes content with orjson.
+
+    orjson is a Rust-backed serializer with native datetime support,
+    significantly faster than the stdlib json encoder used by the
+    default JSONResponse. Used as the default response class for all
+    campaign API endpoints.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize response content to JSON bytes.
+
+        Args:
+            content: Response content (dict, list, model dump, etc.)
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """Clean up incomplete test campaigns."""
+import sys
+import orjson
 import requests
-from config.loader import settings
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from config.loader import get_settings
+from utils.http_retry import retry_request
 
 # Incomplete campaigns to delete
 CAMPAIGNS_TO_DELETE = [
@@ -10,37 +15,87 @@ CAMPAIGNS_TO_DELETE = [
     "120238656605560005"
 ]
 
-ACCESS_TOKEN = settings.meta_access_token
+ACCESS_TOKEN = get_settings().meta_access_token
+
+# Shared session so the TLS handshake to graph.facebook.com is paid
+# once instead of per-DELETE
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
 
 def delete_campaign(campaign_id):
-    """Delete a campaign."""
+    """Delete a campaign.
+
+    Returns:
+        tuple: (success, report line) - printing is left to the caller
+            so thread-pooled deletions don't interleave output
+    """
     url = f"https://graph.facebook.com/v22.0/{campaign_id}"
     params = {
         'access_token': ACCESS_TOKEN
     }
 
-    print(f"Deleting campaign {campaign_id}...", end=" ")
-    response = requests.delete(url, params=params)
+    response = retry_request(lambda: SESSION.delete(url, params=params, timeout=30))
 
     if response.status_code == 200:
         result = response.json()
         if result.get('success'):
-            print("✅ Deleted")
-            return True
+            return True, f"Deleting campaign {campaign_id}... ✅ Deleted"
+        return False, f"Deleting campaign {campaign_id}... ❌ Failed: {result}"
+    return False, f"Deleting campaign {campaign_id}... ❌ HTTP {response.status_code}: {response.text}"
+
+def delete_campaigns_batch(campaign_ids):
+    """Delete campaigns via one Graph API batch request.
+
+    Returns:
+        tuple: (failed campaign IDs, report lines)
+    """
+    batch = orjson.dumps([
+        {'method': 'DELETE', 'relative_url': cid}
+        for cid in campaign_ids
+    ]).decode()
+    response = retry_request(lambda: SESSION.post(
+        "https://graph.facebook.com/v22.0/",
+        data={'access_token': ACCESS_TOKEN, 'batch': batch},
+        timeout=60
+    ))
+
+    if response.status_code != 200:
+        return list(campaign_ids), [
+            f"❌ Batch request failed: HTTP {response.status_code}: {response.text}"
+        ]
+
+    failed = []
+    lines = []
+    for campaign_id, sub in zip(campaign_ids, response.json()):
+        body = orjson.loads(sub['body']) if sub and sub.get('body') else {}
+        if sub and sub.get('code') == 200 and body.get('success'):
+            lines.append(f"Deleting campaign {campaign_id}... ✅ Deleted")
         else:
-            print(f"❌ Failed: {result}")
-            return False
-    else:
-        print(f"❌ HTTP {response.status_code}: {response.text}")
-        return False
-
-print("=" * 70)
-print("  Cleaning Up Incomplete Test Campaigns")
-print("=" * 70)
-
-deleted_count = 0
-for campaign_id in CAMPAIGNS_TO_DELETE:
-    if delete_campaign(campaign_id):
-        deleted_count += 1
-
-print(f"\n✅ Cleanup complete: {deleted_count}/{len(CAMPAIGNS_TO_DELETE)} campaigns deleted")
+            lines.append(f"Deleting campaign {campaign_id}... ❌ Failed: {body or sub}")
+            failed.append(campaign_id)
+    return failed, lines
+
+
+output = [
+    "=" * 70,
+    "  Cleaning Up Incomplete Test Campaigns",
+    "=" * 70,
+]
+
+# One batch POST covers all deletions in a single round-trip; any
+# sub-requests that fail are retried individually in parallel
+failed_ids, lines = delete_campaigns_batch(CAMPAIGNS_TO_DELETE)
+output.extend(lines)
+deleted_count = len(CAMPAIGNS_TO_DELETE) - len(failed_ids)
+
+if failed_ids:
+    output.append(f"\nRetrying {len(failed_ids)} failed deletion(s) individually...")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(delete_campaign, failed_ids))
+    output.extend(line for _, line in results)
+    deleted_count += sum(ok for ok, _ in results)
+
+output.append(f"\n✅ Cleanup complete: {deleted_count}/{len(CAMPAIGNS_TO_DELETE)} campaigns deleted")
+
+# Single buffered write instead of per-line print/flush
+sys.stdout.write("\n".join(output) + "\n")
@@ -1,9 +1,15 @@
 """Configuration loader for application settings."""
+import copy
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe-load
+# grammar, just parsed in C
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -27,9 +33,32 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=128)
+def _load_campaign_config_cached(config_path: str, mtime_ns: int) -> dict:
+    """Parse a campaign YAML file, cached by (path, mtime).
+
+    The mtime_ns argument is part of the cache key so an edited file is
+    re-parsed while unchanged files are served from memory.
+
+    Args:
+        config_path: Path to YAML config file
+        mtime_ns: File mtime in nanoseconds (cache key component)
+
+    Returns:
+        dict: Parsed campaign configuration
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_campaign_config(config_path: str) -> dict:
     """Load campaign configuration from YAML file.
 
+    Parsed configs are cached keyed by path and mtime, so repeat loads
+    of an unchanged file skip disk I/O and YAML parsing. A deep copy is
+    returned so callers can mutate the result without poisoning the
+    cache.
+
     Args:
         config_path: Path to YAML config file (relative to project root)
 
@@ -40,14 +69,24 @@ def load_campaign_config(config_path: str) -> dict:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If YAML is invalid
     """
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Campaign config not found: {config_path}")
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _load_campaign_config_cached(config_path, st.st_mtime_ns)
+    return copy.deepcopy(config)
 
-    return config
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared Settings instance.
+
+    Cached so the .env file and environment are parsed once per
+    process; tests can reset with get_settings.cache_clear().
+    """
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
+# Global settings instance (kept for existing importers)
+settings = get_settings()
@@ -1,4 +1,7 @@
 """Configuration validation."""
+import hashlib
+import os
+import orjson
 from pathlib import Path
 from typing import Dict, Any
 from utils.exceptions import ValidationError, ConfigError
@@ -6,6 +9,34 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Supported video container formats
+_VIDEO_EXTS = frozenset({'.mp4', '.mov'})
+
+# Required top-level campaign config fields
+_REQUIRED_FIELDS = frozenset({
+    'campaign_id',
+    'client_account_id',
+    'name',
+    'daily_budget',
+    'video',
+    'primary_text',
+    'headline',
+    'destination_url'
+})
+
+# Supported call-to-action types; tuple kept alongside the frozenset so
+# error messages list them in a stable order
+_VALID_CTAS_TUPLE = (
+    'SHOP_NOW', 'LEARN_MORE', 'SIGN_UP', 'DOWNLOAD', 'WATCH_MORE',
+    'APPLY_NOW', 'BOOK_TRAVEL', 'CONTACT_US', 'GET_QUOTE', 'SUBSCRIBE'
+)
+_VALID_CTAS = frozenset(_VALID_CTAS_TUPLE)
+
+# Content hashes of configs that already passed validation; checks are
+# pure, so an unchanged config doesn't need re-checking
+_VALIDATED_HASHES = set()
+_VALIDATED_HASHES_MAX = 128
+
 
 def validate_campaign_config(config: Dict[str, Any]) -> None:
     """Validate campaign configuration.
@@ -16,19 +47,16 @@ def validate_campaign_config(config: Dict[str, Any]) -> None:
     Raises:
         ConfigError: If configuration is invalid
     """
+    # Skip re-validating a config we've already seen unchanged
+    config_hash = hashlib.blake2b(
+        orjson.dumps(config, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).digest()
+    if config_hash in _VALIDATED_HASHES:
+        return
+
     # Required fields
-    required_fields = [
-        'campaign_id',
-        'client_account_id',
-        'name',
-        'daily_budget',
-        'video',
-        'primary_text',
-        'headline',
-        'destination_url'
-    ]
-
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in config:
             raise ConfigError(f"Missing required field: {field}")
 
@@ -41,12 +69,15 @@ def validate_campaign_config(config: Dict[str, Any]) -> None:
         raise ConfigError(f"daily_budget must be integer >= 100 cents (got: {config['daily_budget']})")
 
     # Validate call_to_action if present
-    valid_ctas = [
-        'SHOP_NOW', 'LEARN_MORE', 'SIGN_UP', 'DOWNLOAD', 'WATCH_MORE',
-        'APPLY_NOW', 'BOOK_TRAVEL', 'CONTACT_US', 'GET_QUOTE', 'SUBSCRIBE'
-    ]
-    if 'call_to_action' in config and config['call_to_action'] not in valid_ctas:
-        raise ConfigError(f"Invalid call_to_action: {config['call_to_action']}. Must be one of: {valid_ctas}")
+    if 'call_to_action' in config and config['call_to_action'] not in _VALID_CTAS:
+        raise ConfigError(
+            f"Invalid call_to_action: {config['call_to_action']}. "
+            f"Must be one of: {list(_VALID_CTAS_TUPLE)}"
+        )
+
+    if len(_VALIDATED_HASHES) >= _VALIDATED_HASHES_MAX:
+        _VALIDATED_HASHES.clear()
+    _VALIDATED_HASHES.add(config_hash)
 
     logger.debug(f"Campaign config validated: {config['campaign_id']}")
 
@@ -62,16 +93,18 @@ def validate_video_file(video_path: str) -> None:
     """
     path = Path(video_path)
 
-    # Check file exists
-    if not path.exists():
+    # Single stat covers existence and size
+    try:
+        st = os.stat(video_path)
+    except FileNotFoundError:
         raise ValidationError(f"Video file not found: {video_path}")
 
     # Check file extension
-    if path.suffix.lower() not in ['.mp4', '.mov']:
+    if path.suffix.lower() not in _VIDEO_EXTS:
         raise ValidationError(f"Unsupported video format: {path.suffix}. Use .mp4 or .mov")
 
     # Check file size (4GB Meta limit)
-    size_mb = path.stat().st_size / (1024 * 1024)
+    size_mb = st.st_size / (1024 * 1024)
     if size_mb > 4096:
         raise ValidationError(f"Video file too large: {size_mb:.1f}MB. Maximum 4096MB")
 
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Pretty-print data files for humans (storage writes compact JSON)."""
+import sys
+from pathlib import Path
+import orjson
+
+DATA_DIR = Path("data")
+
+files = sys.argv[1:] or ['accounts.json', 'campaigns.json', 'schedules.json']
+
+output = []
+for filename in files:
+    file_path = DATA_DIR / filename
+    if not file_path.exists():
+        output.append(f"(missing) {file_path}")
+        continue
+    data = orjson.loads(file_path.read_bytes())
+    output.extend([
+        "=" * 70,
+        f"  {file_path}",
+        "=" * 70,
+        orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
+    ])
+
+sys.stdout.write("\n".join(output) + "\n")
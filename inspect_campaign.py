@@ -1,57 +1,52 @@
 #!/usr/bin/env python3
 """Inspect existing campaign to understand the correct parameters."""
+import sys
 import requests
-import json
-from config.loader import settings
+from requests.adapters import HTTPAdapter
+import orjson
+from config.loader import get_settings
+from utils.http_retry import retry_request
 
 # Your working campaign ID
 CAMPAIGN_ID = "120236830809450005"
-ACCESS_TOKEN = settings.meta_access_token
+ACCESS_TOKEN = get_settings().meta_access_token
 
-def fetch_campaign():
-    """Fetch campaign details."""
-    url = f"https://graph.facebook.com/v22.0/{CAMPAIGN_ID}"
-    params = {
-        'access_token': ACCESS_TOKEN,
-        'fields': 'id,name,objective,status,special_ad_categories'
-    }
-    response = requests.get(url, params=params)
-    return response.json()
+# Shared session so all three fetches reuse one TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
 
-def fetch_adsets():
-    """Fetch adsets for the campaign."""
-    url = f"https://graph.facebook.com/v22.0/{CAMPAIGN_ID}/adsets"
-    params = {
-        'access_token': ACCESS_TOKEN,
-        'fields': 'id,name,optimization_goal,billing_event,bid_strategy,daily_budget,targeting,promoted_object,destination_type,status,regional_regulated_categories,regional_regulation_identities'
-    }
-    response = requests.get(url, params=params)
-    return response.json()
+def fetch_campaign_tree():
+    """Fetch campaign, its adsets, and their ads in one request.
 
-def fetch_ads(adset_id):
-    """Fetch ads for an adset."""
-    url = f"https://graph.facebook.com/v22.0/{adset_id}/ads"
+    Graph API field expansion returns the whole nested structure in a
+    single round-trip instead of three sequential calls.
+    """
+    url = f"https://graph.facebook.com/v22.0/{CAMPAIGN_ID}"
     params = {
         'access_token': ACCESS_TOKEN,
-        'fields': 'id,name,status,creative'
+        'fields': (
+            'id,name,objective,status,special_ad_categories,'
+            'adsets{id,name,optimization_goal,billing_event,bid_strategy,'
+            'daily_budget,targeting,promoted_object,destination_type,status,'
+            'regional_regulated_categories,regional_regulation_identities,'
+            'ads{id,name,status,creative}}'
+        )
     }
-    response = requests.get(url, params=params)
+    response = retry_request(lambda: SESSION.get(url, params=params, timeout=30))
     return response.json()
 
-print("=" * 70)
-print("  Inspecting Your Working Campaign")
-print("=" * 70)
-
-print("\n📋 Campaign Details:")
-campaign = fetch_campaign()
-print(json.dumps(campaign, indent=2))
-
-print("\n📋 AdSets:")
-adsets = fetch_adsets()
-print(json.dumps(adsets, indent=2))
-
-if 'data' in adsets and len(adsets['data']) > 0:
-    adset_id = adsets['data'][0]['id']
-    print(f"\n📋 Ads in AdSet {adset_id}:")
-    ads = fetch_ads(adset_id)
-    print(json.dumps(ads, indent=2))
+campaign = fetch_campaign_tree()
+adsets = campaign.pop('adsets', {})
+
+# Pretty-print with orjson and flush stdout once
+sys.stdout.write("\n".join([
+    "=" * 70,
+    "  Inspecting Your Working Campaign",
+    "=" * 70,
+    "",
+    "📋 Campaign Details:",
+    orjson.dumps(campaign, option=orjson.OPT_INDENT_2).decode(),
+    "",
+    "📋 AdSets (with nested Ads):",
+    orjson.dumps(adsets, option=orjson.OPT_INDENT_2).decode(),
+]) + "\n")
@@ -1,47 +1,117 @@
 """Main application entry point."""
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from api.orjson_response import ORJSONResponse
 from config.loader import settings
 from utils.logger import setup_logger
-from api.routes import router
+from api.routes import router, get_meta_client
 from scheduler.manager import get_scheduler_manager
+from utils.exceptions import (
+    MetaAPIError,
+    SchedulingError,
+    ValidationError,
+    ConfigError,
+    StorageError
+)
 
 # Setup logger
 logger = setup_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown lifecycle."""
+    logger.info("Starting Meta Ad Campaign Automation service...")
+    logger.info(f"API running on {settings.api_host}:{settings.api_port}")
+    logger.info(f"Log level: {settings.log_level}")
+
+    # Start scheduler; kept on app.state so shutdown (and any handler
+    # via request.app.state) operates on the same instance
+    app.state.scheduler = get_scheduler_manager(data_dir=settings.data_dir)
+    app.state.scheduler.start()
+    logger.info("Scheduler started successfully")
+
+    yield
+
+    logger.info("Shutting down Meta Ad Campaign Automation service...")
+    app.state.scheduler.shutdown()
+    logger.info("Scheduler shutdown successfully")
+
+    # Release pooled Meta API connections if a client was created
+    if get_meta_client.cache_info().currsize:
+        get_meta_client().close()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Meta Ad Campaign Automation",
     description="Automate Advantage+ Sales campaign creation and scheduling",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Include API routes
 app.include_router(router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info("Starting Meta Ad Campaign Automation service...")
-    logger.info(f"API running on {settings.api_host}:{settings.api_port}")
-    logger.info(f"Log level: {settings.log_level}")
+# ============================================================================
+# Exception Handlers
+# ============================================================================
+# Domain exceptions are mapped to HTTP responses once here, so route
+# handlers raise them directly instead of each carrying its own
+# try/except ladder. Response bodies keep FastAPI's {"detail": ...}
+# shape that clients already see from HTTPException.
 
-    # Start scheduler
-    scheduler = get_scheduler_manager(data_dir=settings.data_dir)
-    scheduler.start()
-    logger.info("Scheduler started successfully")
+@app.exception_handler(FileNotFoundError)
+async def file_not_found_handler(request: Request, exc: FileNotFoundError):
+    """Missing config/video files -> 404."""
+    logger.error(f"File not found: {exc}")
+    return ORJSONResponse(
+        status_code=404,
+        content={"detail": f"File not found: {exc}"}
+    )
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info("Shutting down Meta Ad Campaign Automation service...")
+@app.exception_handler(ValidationError)
+@app.exception_handler(ConfigError)
+async def validation_error_handler(request: Request, exc: Exception):
+    """Invalid campaign config or input -> 400."""
+    logger.error(f"Validation error: {exc}")
+    return ORJSONResponse(
+        status_code=400,
+        content={"detail": str(exc)}
+    )
 
-    # Shutdown scheduler
-    scheduler = get_scheduler_manager(data_dir=settings.data_dir)
-    scheduler.shutdown()
-    logger.info("Scheduler shutdown successfully")
+
+@app.exception_handler(MetaAPIError)
+async def meta_api_error_handler(request: Request, exc: MetaAPIError):
+    """Meta API failures (incl. campaign creation/video upload) -> 500."""
+    logger.error(f"Meta API error: {exc}")
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(SchedulingError)
+@app.exception_handler(StorageError)
+async def internal_error_handler(request: Request, exc: Exception):
+    """Scheduler or storage failures -> 500."""
+    logger.error(f"{type(exc).__name__}: {exc}")
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(Exception)
+async def unexpected_error_handler(request: Request, exc: Exception):
+    """Catch-all for anything the domain exceptions don't cover."""
+    logger.exception(f"Unexpected error: {exc}")
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": f"Unexpected error: {exc}"}
+    )
 
 
 @app.get("/")
@@ -57,10 +127,7 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return JSONResponse(
-        status_code=200,
-        content={"status": "healthy"}
-    )
+    return {"status": "healthy"}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""Thread-safe TTL cache for read-mostly Meta API responses."""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Small thread-safe cache with per-entry age tracking.
+
+    Entries expire ttl seconds after being stored and are dropped
+    lazily on access. Callers wanting stale-while-revalidate semantics
+    can inspect the age returned by get_entry and trigger a background
+    refresh while still serving the cached value.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        """Initialize cache.
+
+        Args:
+            ttl: Entry lifetime in seconds
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+
+    def get_entry(self, key: Any) -> Optional[Tuple[Any, float]]:
+        """Get a fresh entry with its age.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            tuple or None: (value, age in seconds) if cached and fresh
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            age = now - stored_at
+            if age > self.ttl:
+                del self._data[key]
+                return None
+            return value, age
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a fresh cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if absent/expired
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: Any, value: Any):
+        """Store a value, evicting the oldest entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest]
+            self._data[key] = (time.monotonic(), value)
+
+    def pop(self, key: Any):
+        """Invalidate an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
@@ -1,6 +1,9 @@
 """Campaign creation orchestration - 6-step process."""
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from zoneinfo import ZoneInfo
 from meta.client import MetaAPIClient
 from meta.creative import upload_video_creative, create_video_ad_creative
 from meta.validator import extract_id, validate_account_id
@@ -9,6 +12,26 @@ from utils.exceptions import CampaignCreationError, MetaAPIError
 
 logger = setup_logger(__name__)
 
+# Tokens that mark a campaign as Singapore-targeted
+_SG_TOKENS = frozenset({'SG', 'Singapore'})
+
+# Naive start times are interpreted as Singapore time (GMT+8)
+_SG_TZ = ZoneInfo('Asia/Singapore')
+
+# Static part of the Advantage+ adset targeting spec; geo_locations is
+# merged in per campaign
+_TARGETING_TEMPLATE = {
+    'age_min': 18,
+    'age_max': 65,
+    'targeting_automation': {
+        'advantage_audience': 1,
+        'individual_setting': {
+            'age': 1,
+            'gender': 1
+        }
+    }
+}
+
 
 def create_advantage_plus_campaign(
     client: MetaAPIClient,
@@ -51,7 +74,18 @@ def create_advantage_plus_campaign(
         # Validate account ID format
         validate_account_id(account_id)
 
+        # Destructure config fields into locals once; Steps 1-5 below
+        # then work on plain locals instead of repeated dict lookups
         campaign_name = campaign_config['name']
+        video_path = campaign_config['video']['file_path']
+        primary_text = campaign_config['primary_text']
+        headline = campaign_config['headline']
+        description = campaign_config.get('description', '')
+        call_to_action = campaign_config.get('call_to_action', 'SHOP_NOW')
+        destination_url = campaign_config['destination_url']
+        daily_budget = campaign_config['daily_budget']
+        geo_locations = campaign_config.get('geo_locations', {'countries': ['SG']})
+
         logger.info(f"Starting campaign creation: {campaign_name}")
 
         # Get account assets (with overrides from campaign config)
@@ -61,7 +95,6 @@ def create_advantage_plus_campaign(
         # ================================================================
         # Step 1: Upload Video
         # ================================================================
-        video_path = campaign_config['video']['file_path']
         logger.info(f"Step 1/6: Uploading video from {video_path}")
 
         video_id = upload_video_creative(client, account_id, video_path)
@@ -72,37 +105,13 @@ def create_advantage_plus_campaign(
         # ================================================================
         logger.info(f"Step 2/6: Creating video ad creative")
 
-        primary_text = campaign_config['primary_text']
-        headline = campaign_config['headline']
-        description = campaign_config.get('description', '')
-        call_to_action = campaign_config.get('call_to_action', 'SHOP_NOW')
-        destination_url = campaign_config['destination_url']
-
-        # Add URL parameters if provided
-        if 'url_parameters' in campaign_config and campaign_config['url_parameters']:
-            url_params = campaign_config['url_parameters']
-            separator = '&' if '?' in destination_url else '?'
-            destination_url = f"{destination_url}{separator}{url_params}"
-
-        creative_id = create_video_ad_creative(
-            client=client,
-            account_id=account_id,
-            video_id=video_id,
-            page_id=page_id,
-            primary_text=primary_text,
-            headline=headline,
-            description=description,
-            call_to_action=call_to_action,
-            destination_url=destination_url
-        )
-        created_ids['creative_id'] = creative_id
-
-        # ================================================================
-        # Step 3: Create Campaign
-        # ================================================================
-        logger.info(f"Step 3/6: Creating campaign")
-
-        daily_budget = campaign_config['daily_budget']
+        # Merge URL parameters if provided; urllib handles existing
+        # query strings correctly instead of a manual separator branch
+        if campaign_config.get('url_parameters'):
+            parts = urlsplit(destination_url)
+            query = dict(parse_qsl(parts.query))
+            query.update(parse_qsl(campaign_config['url_parameters']))
+            destination_url = urlunsplit(parts._replace(query=urlencode(query)))
 
         campaign_params = {
             'name': campaign_name,
@@ -114,18 +123,49 @@ def create_advantage_plus_campaign(
             'buying_type': 'AUCTION'  # Explicitly set buying type
         }
 
-        campaign_data = client.create_campaign(account_id, campaign_params)
-        campaign_id = extract_id(campaign_data)
-        created_ids['campaign_id'] = campaign_id
+        # Steps 2 and 3 both depend only on Step 1, so run them
+        # concurrently to take one Graph API round-trip off the
+        # critical path
+        logger.info(f"Step 3/6: Creating campaign")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            creative_future = executor.submit(
+                create_video_ad_creative,
+                client=client,
+                account_id=account_id,
+                video_id=video_id,
+                page_id=page_id,
+                primary_text=primary_text,
+                headline=headline,
+                description=description,
+                call_to_action=call_to_action,
+                destination_url=destination_url
+            )
+            campaign_future = executor.submit(
+                client.create_campaign, account_id, campaign_params
+            )
+
+        # Record whichever succeeded before raising, so the failure log
+        # below lists every object that needs manual cleanup
+        errors = []
+        try:
+            created_ids['creative_id'] = creative_future.result()
+        except Exception as e:
+            errors.append(e)
+        try:
+            created_ids['campaign_id'] = extract_id(campaign_future.result())
+        except Exception as e:
+            errors.append(e)
+        if errors:
+            raise errors[0]
+
+        creative_id = created_ids['creative_id']
+        campaign_id = created_ids['campaign_id']
 
         # ================================================================
         # Step 4: Create AdSet (with Advantage+ configuration)
         # ================================================================
         logger.info(f"Step 4/6: Creating AdSet with Advantage+ configuration")
 
-        # Get geo targeting (default to Singapore if not specified)
-        geo_locations = campaign_config.get('geo_locations', {'countries': ['SG']})
-
         adset_params = {
             'name': f"{campaign_name} - AdSet",
             'campaign_id': campaign_id,
@@ -136,30 +176,22 @@ def create_advantage_plus_campaign(
                 'custom_event_type': 'PURCHASE'
             },
             # Note: No daily_budget here - using Campaign Budget Optimization (CBO)
-            'targeting': {
-                'age_min': 18,
-                'age_max': 65,
-                'geo_locations': geo_locations,
-                'targeting_automation': {
-                    'advantage_audience': 1,
-                    'individual_setting': {
-                        'age': 1,
-                        'gender': 1
-                    }
-                }
-            },
+            'targeting': {**_TARGETING_TEMPLATE, 'geo_locations': geo_locations},
             'status': 'PAUSED'
         }
 
         # Add start_time if provided
         if start_time:
-            # Format as ISO 8601 string for Meta API (YYYY-MM-DDTHH:MM:SS+HHMM)
-            adset_params['start_time'] = start_time.strftime('%Y-%m-%dT%H:%M:%S+0800')
+            # Meta accepts ISO 8601; carry the offset in the datetime
+            # itself instead of a hard-coded +0800 format string
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=_SG_TZ)
+            adset_params['start_time'] = start_time.isoformat(timespec='seconds')
             logger.info(f"Setting AdSet start_time: {adset_params['start_time']}")
 
         # Add Singapore universal ads declaration if targeting Singapore
         countries = geo_locations.get('countries', [])
-        if 'SG' in countries or 'Singapore' in countries:
+        if any(c in _SG_TOKENS for c in countries):
             adset_params['regional_regulated_categories'] = ['SINGAPORE_UNIVERSAL']
 
             # Add beneficiary information for Singapore
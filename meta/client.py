@@ -1,5 +1,11 @@
 """Hybrid Meta Marketing API client using both SDK and direct API calls."""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from facebook_business.api import FacebookAdsApi
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.campaign import Campaign
@@ -9,14 +15,106 @@ from facebook_business.adobjects.adcreative import AdCreative
 from typing import Dict, Any, Optional
 from utils.logger import setup_logger
 from utils.exceptions import MetaAPIError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from utils.http_retry import retry_request
+from meta.cache import TTLCache
+from meta.validator import validate_campaign_status
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+# wait_base is not re-exported from the top-level package in the
+# pinned tenacity==8.2.3
+from tenacity.wait import wait_base
 
 logger = setup_logger(__name__)
 
+# Max bytes sent per resumable-upload transfer phase (default 16MB)
+_UPLOAD_CHUNK_BYTES = int(os.environ.get('META_UPLOAD_CHUNK_MB', '16')) * 1024 * 1024
+
+# Cap on response bodies echoed into logs
+MAX_LOG_BODY = 512
+
+# Meta error codes signalling rate limiting / throttling
+_THROTTLE_CODES = frozenset({4, 17, 32, 613})
+
+
+def _is_throttle_error(exc: BaseException) -> bool:
+    """Check whether an exception is a Meta throttling error.
+
+    Args:
+        exc: Exception raised by an API call
+
+    Returns:
+        bool: True if the error carries a known throttling code
+    """
+    return isinstance(exc, MetaAPIError) and exc.error_code in _THROTTLE_CODES
+
+
+def _estimated_regain_seconds(usage) -> float:
+    """Extract the largest estimated_time_to_regain_access from a
+    rate-limit usage header payload, converted from minutes to seconds.
+
+    Args:
+        usage: Decoded header value (nested dicts/lists)
+
+    Returns:
+        float: Seconds until access is regained, 0.0 if not present
+    """
+    if isinstance(usage, dict):
+        if 'estimated_time_to_regain_access' in usage:
+            return float(usage['estimated_time_to_regain_access']) * 60
+        values = usage.values()
+    elif isinstance(usage, list):
+        values = usage
+    else:
+        return 0.0
+    return max((_estimated_regain_seconds(v) for v in values), default=0.0)
+
+
+class MetaRateLimitWait(wait_base):
+    """Tenacity wait strategy honoring Meta's rate-limit headers.
+
+    When the failed response carries X-Business-Use-Case-Usage or
+    X-Ad-Account-Usage with an estimated_time_to_regain_access, sleep
+    exactly that long (capped at 5 minutes); otherwise defer to the
+    fallback strategy.
+    """
+
+    def __init__(self, fallback: wait_base):
+        """Initialize wait strategy.
+
+        Args:
+            fallback: Strategy used when no usage headers are present
+        """
+        self.fallback = fallback
+
+    def __call__(self, retry_state) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        response = getattr(exc, 'response', None)
+        if response is not None:
+            for header in ('X-Business-Use-Case-Usage', 'X-Ad-Account-Usage'):
+                raw = response.headers.get(header)
+                if not raw:
+                    continue
+                try:
+                    seconds = _estimated_regain_seconds(orjson.loads(raw))
+                except orjson.JSONDecodeError:
+                    continue
+                if seconds > 0:
+                    return min(seconds, 300.0)
+        return self.fallback(retry_state)
+
 
 class MetaAPIClient:
     """Hybrid Meta API client using SDK for some operations, direct API for others."""
 
+    # (access_token, api_version) the SDK global state was last
+    # initialized with; repeat instantiations skip the re-init
+    _sdk_initialized = None
+
     def __init__(self, access_token: str, api_version: str = "v22.0"):
         """Initialize Meta API client.
 
@@ -28,9 +126,37 @@ class MetaAPIClient:
         self.api_version = api_version
         self.base_url = f"https://graph.facebook.com/{api_version}"
 
-        # Initialize Facebook SDK with API version
-        FacebookAdsApi.init(access_token=access_token, api_version=api_version)
-        logger.info(f"Meta API client initialized (version: {api_version})")
+        # Pooled session so every direct API call reuses warm TLS
+        # connections instead of handshaking per request; the Bearer
+        # header keeps the token out of query strings and logs
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        )
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
+
+        # Read-mostly response caches. Thumbnails and the ad-account
+        # list rarely change; campaign data uses a short TTL with
+        # stale-while-revalidate so hits stay a dict lookup while a
+        # background refresh keeps entries current.
+        self._thumbnail_cache = TTLCache(ttl=3600)
+        self._accounts_cache = TTLCache(ttl=900)
+        self._campaign_cache = TTLCache(ttl=60)
+        self._refresh_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='meta-cache-refresh'
+        )
+
+        # Initialize Facebook SDK with API version (once per token/version)
+        if MetaAPIClient._sdk_initialized != (access_token, api_version):
+            FacebookAdsApi.init(access_token=access_token, api_version=api_version)
+            MetaAPIClient._sdk_initialized = (access_token, api_version)
+        logger.info("Meta API client initialized (version: %s)", api_version)
+
+    def close(self):
+        """Close the pooled HTTP session and refresh pool."""
+        self._refresh_pool.shutdown(wait=False)
+        self.session.close()
 
     def _handle_api_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and check for errors.
@@ -45,8 +171,10 @@ class MetaAPIClient:
             MetaAPIError: If API returns error
         """
         try:
-            data = response.json()
-        except ValueError:
+            # orjson parses the raw bytes directly - faster than
+            # response.json() and skips the intermediate str decode
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             raise MetaAPIError(f"Invalid JSON response: {response.text}")
 
         # Check for Meta API error
@@ -54,24 +182,80 @@ class MetaAPIClient:
             error = data['error']
             error_code = error.get('code', 'unknown')
             error_msg = error.get('message', 'Unknown error')
-            raise MetaAPIError(f"Meta API Error (#{error_code}): {error_msg}")
+            raise MetaAPIError(
+                f"Meta API Error (#{error_code}): {error_msg}",
+                error_code=error_code,
+                response=response
+            )
 
         if not response.ok:
-            raise MetaAPIError(f"HTTP {response.status_code}: {response.text}")
+            raise MetaAPIError(
+                f"HTTP {response.status_code}: {response.text}",
+                response=response
+            )
 
         return data
 
+    @staticmethod
+    def _format_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten nested dict/list values to JSON strings for form posts.
+
+        The Graph API expects nested objects as JSON-encoded strings in
+        form-encoded bodies.
+
+        Args:
+            params: Raw parameters
+
+        Returns:
+            dict: Parameters with nested values JSON-encoded
+        """
+        return {
+            key: (orjson.dumps(value).decode() if isinstance(value, (dict, list)) else value)
+            for key, value in params.items()
+        }
+
     # ===================================================================
     # Direct API Methods (used for video upload, status updates, fetching)
     # ===================================================================
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.exceptions.RequestException)
+        wait=MetaRateLimitWait(fallback=wait_exponential(multiplier=1, min=2, max=10)),
+        retry=(retry_if_exception_type(requests.exceptions.RequestException)
+               | retry_if_exception(_is_throttle_error))
     )
+    def _upload_video_phase(self, url: str, data: Dict[str, Any],
+                            files: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """POST one phase of a resumable upload, retrying transient failures.
+
+        Retries happen per phase, so a dropped connection re-sends only
+        the current chunk rather than the whole file. Throttling errors
+        are retried after the server-signalled wait (see
+        MetaRateLimitWait).
+
+        Args:
+            url: Upload endpoint URL
+            data: Phase form fields (upload_phase, offsets, etc.)
+            files: Optional chunk payload
+
+        Returns:
+            dict: Decoded phase response
+
+        Raises:
+            MetaAPIError: If the API returns an error
+        """
+        return self._handle_api_response(
+            self.session.post(url, data=data, files=files, timeout=300)
+        )
+
     def upload_video(self, account_id: str, video_path: str) -> str:
-        """Upload video using direct API (cleaner file handling).
+        """Upload video using Meta's resumable upload protocol.
+
+        The file is streamed in fixed-size chunks through the
+        start/transfer/finish phases, so memory stays O(chunk_size)
+        instead of buffering the whole video, and multi-GB uploads
+        survive transient failures by retrying individual chunks.
+        Chunk size defaults to 16MB (META_UPLOAD_CHUNK_MB env var).
 
         Args:
             account_id: Ad account ID (with act_ prefix)
@@ -86,24 +270,57 @@ class MetaAPIClient:
         url = f"{self.base_url}/{account_id}/advideos"
 
         try:
-            with open(video_path, 'rb') as video_file:
-                files = {'source': video_file}
-                params = {'access_token': self.access_token}
-
-                logger.info(f"Uploading video: {video_path}")
-                response = requests.post(url, files=files, params=params, timeout=300)
+            file_size = os.path.getsize(video_path)
+        except FileNotFoundError:
+            raise MetaAPIError(f"Video file not found: {video_path}")
 
-            data = self._handle_api_response(response)
-            video_id = data.get('id')
+        try:
+            logger.info("Uploading video: %s (%d bytes)", video_path, file_size)
+
+            # Phase 1: start - open an upload session
+            start_data = self._upload_video_phase(url, {
+                'upload_phase': 'start',
+                'file_size': file_size
+            })
+            session_id = start_data['upload_session_id']
+            video_id = start_data.get('video_id')
+            start_offset = int(start_data['start_offset'])
+            end_offset = int(start_data['end_offset'])
+
+            # Phase 2: transfer - stream the requested byte windows,
+            # capped at the configured chunk size
+            with open(video_path, 'rb') as video_file:
+                while start_offset < end_offset:
+                    video_file.seek(start_offset)
+                    chunk = video_file.read(
+                        min(end_offset - start_offset, _UPLOAD_CHUNK_BYTES)
+                    )
+                    transfer_data = self._upload_video_phase(
+                        url,
+                        {
+                            'upload_phase': 'transfer',
+                            'upload_session_id': session_id,
+                            'start_offset': start_offset
+                        },
+                        files={'video_file_chunk': chunk}
+                    )
+                    start_offset = int(transfer_data['start_offset'])
+                    end_offset = int(transfer_data['end_offset'])
+
+            # Phase 3: finish - commit the session
+            self._upload_video_phase(url, {
+                'upload_phase': 'finish',
+                'upload_session_id': session_id
+            })
 
             if not video_id:
-                raise MetaAPIError(f"No video ID in response: {data}")
+                raise MetaAPIError(f"No video ID in start response: {start_data}")
 
-            logger.info(f"Video uploaded successfully: {video_id}")
+            logger.info("Video uploaded successfully: %s", video_id)
             return video_id
 
-        except FileNotFoundError:
-            raise MetaAPIError(f"Video file not found: {video_path}")
+        except MetaAPIError:
+            raise
         except Exception as e:
             raise MetaAPIError(f"Video upload failed: {e}")
 
@@ -119,21 +336,23 @@ class MetaAPIClient:
         Raises:
             MetaAPIError: If fetch fails
         """
+        cached = self._thumbnail_cache.get(video_id)
+        if cached:
+            return cached
+
         url = f"{self.base_url}/{video_id}"
-        params = {
-            'access_token': self.access_token,
-            'fields': 'picture'
-        }
+        params = {'fields': 'picture'}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = retry_request(lambda: self.session.get(url, params=params, timeout=30))
             data = self._handle_api_response(response)
             thumbnail_url = data.get('picture')
 
             if not thumbnail_url:
                 raise MetaAPIError(f"No thumbnail URL in response: {data}")
 
-            logger.debug(f"Got thumbnail for video {video_id}")
+            self._thumbnail_cache.set(video_id, thumbnail_url)
+            logger.debug("Got thumbnail for video %s", video_id)
             return thumbnail_url
         except Exception as e:
             raise MetaAPIError(f"Failed to get video thumbnail {video_id}: {e}")
@@ -141,6 +360,32 @@ class MetaAPIClient:
     def get_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Fetch campaign details using direct API.
 
+        Recently fetched campaigns are served from a short-TTL cache;
+        entries past half their TTL are returned immediately while a
+        background refresh replaces them (stale-while-revalidate).
+
+        Args:
+            campaign_id: Meta campaign ID
+
+        Returns:
+            dict: Campaign data (shared with the cache - treat as
+                read-only, copy before mutating)
+
+        Raises:
+            MetaAPIError: If fetch fails
+        """
+        entry = self._campaign_cache.get_entry(campaign_id)
+        if entry is not None:
+            data, age = entry
+            if age > self._campaign_cache.ttl / 2:
+                self._refresh_pool.submit(self._refresh_campaign, campaign_id)
+            return data
+
+        return self._fetch_campaign(campaign_id)
+
+    def _fetch_campaign(self, campaign_id: str) -> Dict[str, Any]:
+        """Fetch campaign from the API and update the cache.
+
         Args:
             campaign_id: Meta campaign ID
 
@@ -151,19 +396,28 @@ class MetaAPIClient:
             MetaAPIError: If fetch fails
         """
         url = f"{self.base_url}/{campaign_id}"
-        params = {
-            'access_token': self.access_token,
-            'fields': 'id,name,status,daily_budget,lifetime_budget,updated_time'
-        }
+        params = {'fields': 'id,name,status,daily_budget,lifetime_budget,updated_time'}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = retry_request(lambda: self.session.get(url, params=params, timeout=30))
             data = self._handle_api_response(response)
-            logger.debug(f"Fetched campaign: {campaign_id}")
+            self._campaign_cache.set(campaign_id, data)
+            logger.debug("Fetched campaign: %s", campaign_id)
             return data
         except Exception as e:
             raise MetaAPIError(f"Failed to fetch campaign {campaign_id}: {e}")
 
+    def _refresh_campaign(self, campaign_id: str):
+        """Background cache refresh; failures just leave the old entry.
+
+        Args:
+            campaign_id: Meta campaign ID
+        """
+        try:
+            self._fetch_campaign(campaign_id)
+        except MetaAPIError as e:
+            logger.debug("Background refresh failed for %s: %s", campaign_id, e)
+
     def update_campaign_status(self, campaign_id: str, status: str) -> Dict[str, Any]:
         """Update campaign status using direct API (simple field update).
 
@@ -177,20 +431,32 @@ class MetaAPIClient:
         Raises:
             MetaAPIError: If update fails
         """
-        if status not in ['ACTIVE', 'PAUSED', 'ARCHIVED']:
-            raise MetaAPIError(f"Invalid status: {status}. Must be ACTIVE, PAUSED, or ARCHIVED")
+        validate_campaign_status(status)
+
+        # Skip the write when the cached campaign already has this
+        # status (e.g. an idempotent retry after a partial failure)
+        cached = self._campaign_cache.get(campaign_id)
+        if cached and cached.get('status') == status:
+            logger.debug("Campaign %s already %s, skipping update", campaign_id, status)
+            return {'success': True, 'cached': True}
 
         url = f"{self.base_url}/{campaign_id}"
-        data = {
-            'status': status,
-            'access_token': self.access_token
-        }
+        data = {'status': status}
 
         try:
-            logger.info(f"Updating campaign {campaign_id} status to {status}")
-            response = requests.post(url, data=data, timeout=30)
+            logger.info("Updating campaign %s status to %s", campaign_id, status)
+            response = retry_request(lambda: self.session.post(url, data=data, timeout=30))
             result = self._handle_api_response(response)
-            logger.info(f"Campaign status updated: {campaign_id} -> {status}")
+            # Keep the cached campaign consistent instead of dropping
+            # it. Replace the entry with a fresh dict rather than
+            # mutating in place - the cached object is what
+            # get_campaign hands out, so an in-place edit would change
+            # snapshots callers are already holding.
+            if cached:
+                self._campaign_cache.set(campaign_id, {**cached, 'status': status})
+            else:
+                self._campaign_cache.pop(campaign_id)
+            logger.info("Campaign status updated: %s -> %s", campaign_id, status)
             return result
         except Exception as e:
             raise MetaAPIError(f"Failed to update campaign status: {e}")
@@ -219,7 +485,7 @@ class MetaAPIClient:
             campaign_data = campaign.export_all_data()
             campaign_id = campaign_data.get('id')
 
-            logger.info(f"Campaign created: {campaign_id} - {params.get('name')}")
+            logger.info("Campaign created: %s - %s", campaign_id, params.get('name'))
             return campaign_data
         except Exception as e:
             raise MetaAPIError(f"Failed to create campaign: {e}")
@@ -240,24 +506,16 @@ class MetaAPIClient:
         url = f"{self.base_url}/{account_id}/adsets"
 
         # Convert nested objects to JSON strings (Meta API expects this)
-        import json as json_module
-        params_formatted = {}
-        for key, value in params.items():
-            if isinstance(value, dict) or isinstance(value, list):
-                params_formatted[key] = json_module.dumps(value)
-            else:
-                params_formatted[key] = value
-
-        # Add access token
-        params_formatted['access_token'] = self.access_token
+        params_formatted = self._format_params(params)
 
         try:
-            logger.info(f"Creating adset with formatted params: {params_formatted}")
-            response = requests.post(url, data=params_formatted, timeout=30)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Creating adset with formatted params: %s", params_formatted)
+            response = retry_request(lambda: self.session.post(url, data=params_formatted, timeout=30))
 
-            # Log raw response for debugging
-            logger.info(f"Adset creation response status: {response.status_code}")
-            logger.info(f"Adset creation response body: {response.text}")
+            logger.info("Adset creation response status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Adset creation response body: %s", response.text[:MAX_LOG_BODY])
 
             data = self._handle_api_response(response)
 
@@ -265,7 +523,7 @@ class MetaAPIClient:
             if not adset_id:
                 raise MetaAPIError(f"No adset ID in response: {data}")
 
-            logger.info(f"AdSet created: {adset_id}")
+            logger.info("AdSet created: %s", adset_id)
             return data
         except Exception as e:
             raise MetaAPIError(f"Failed to create adset: {e}")
@@ -290,7 +548,7 @@ class MetaAPIClient:
             creative_data = creative.export_all_data()
             creative_id = creative_data.get('id')
 
-            logger.info(f"Creative created: {creative_id}")
+            logger.info("Creative created: %s", creative_id)
             return creative_data
         except Exception as e:
             raise MetaAPIError(f"Failed to create creative: {e}")
@@ -315,7 +573,7 @@ class MetaAPIClient:
             ad_data = ad.export_all_data()
             ad_id = ad_data.get('id')
 
-            logger.info(f"Ad created: {ad_id}")
+            logger.info("Ad created: %s", ad_id)
             return ad_data
         except Exception as e:
             raise MetaAPIError(f"Failed to create ad: {e}")
@@ -329,17 +587,132 @@ class MetaAPIClient:
         Raises:
             MetaAPIError: If fetch fails
         """
+        cached = self._accounts_cache.get('me')
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/me/adaccounts"
-        params = {
-            'access_token': self.access_token,
-            'fields': 'id,account_id,name,currency'
-        }
+        params = {'fields': 'id,account_id,name,currency'}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = retry_request(lambda: self.session.get(url, params=params, timeout=30))
             data = self._handle_api_response(response)
             accounts = data.get('data', [])
-            logger.info(f"Found {len(accounts)} ad accounts")
+            self._accounts_cache.set('me', accounts)
+            logger.info("Found %d ad accounts", len(accounts))
             return accounts
         except Exception as e:
             raise MetaAPIError(f"Failed to fetch ad accounts: {e}")
+
+    def get_campaigns_concurrent(self, campaign_ids: list, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """Fetch multiple campaigns concurrently over the pooled session.
+
+        The fetches are independent and network-bound, so fanning them
+        out across a small thread pool brings a sync-all loop from
+        N round-trips down to roughly N / max_workers.
+
+        Args:
+            campaign_ids: Meta campaign IDs to fetch
+            max_workers: Upper bound on concurrent requests
+
+        Returns:
+            dict: Mapping of campaign_id -> campaign data
+
+        Raises:
+            MetaAPIError: If any fetch fails
+        """
+        if not campaign_ids:
+            return {}
+
+        workers = min(max_workers, len(campaign_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.get_campaign, campaign_ids))
+        return dict(zip(campaign_ids, results))
+
+    def batch(self, subrequests: list) -> list:
+        """Execute up to 50 Graph API sub-requests in one HTTP POST.
+
+        Args:
+            subrequests: Batch entries, e.g.
+                [{'method': 'GET', 'relative_url': '<id>?fields=...'}]
+
+        Returns:
+            list: Decoded sub-response bodies, in request order
+
+        Raises:
+            MetaAPIError: If the batch call or any sub-request fails
+        """
+        payload = {
+            'batch': orjson.dumps(subrequests).decode(),
+            'include_headers': 'false'
+        }
+
+        try:
+            response = retry_request(
+                lambda: self.session.post(self.base_url, data=payload, timeout=60)
+            )
+            if response.status_code != 200:
+                raise MetaAPIError(f"HTTP {response.status_code}: {response.text}")
+
+            bodies = []
+            for result in orjson.loads(response.content):
+                if result is None:
+                    raise MetaAPIError("Batch sub-request timed out")
+                body = orjson.loads(result['body']) if result.get('body') else {}
+                if result.get('code') != 200:
+                    raise MetaAPIError(
+                        f"Batch sub-request failed (HTTP {result.get('code')}): {body}"
+                    )
+                bodies.append(body)
+            return bodies
+        except MetaAPIError:
+            raise
+        except Exception as e:
+            raise MetaAPIError(f"Batch request failed: {e}")
+
+    def get_campaigns_bulk(self, campaign_ids: list) -> Dict[str, Dict[str, Any]]:
+        """Fetch many campaigns via the batch endpoint.
+
+        N campaigns cost ceil(N/50) HTTP round-trips instead of N;
+        fetched data also lands in the campaign cache.
+
+        Args:
+            campaign_ids: Meta campaign IDs to fetch
+
+        Returns:
+            dict: Mapping of campaign_id -> campaign data
+
+        Raises:
+            MetaAPIError: If any fetch fails
+        """
+        fields = 'id,name,status,daily_budget,lifetime_budget,updated_time'
+        results = {}
+        for i in range(0, len(campaign_ids), 50):
+            chunk = campaign_ids[i:i + 50]
+            subrequests = [
+                {'method': 'GET', 'relative_url': f'{cid}?fields={fields}'}
+                for cid in chunk
+            ]
+            for campaign_id, body in zip(chunk, self.batch(subrequests)):
+                self._campaign_cache.set(campaign_id, body)
+                results[campaign_id] = body
+        logger.debug("Bulk-fetched %d campaigns", len(results))
+        return results
+
+
+@lru_cache(maxsize=4)
+def get_meta_client(access_token: str, api_version: str = "v22.0") -> MetaAPIClient:
+    """Get a shared MetaAPIClient for a token/version pair.
+
+    Cached so callers like the scheduler job, which fire repeatedly,
+    reuse one client (and its warm connection pool and caches) instead
+    of rebuilding it per invocation.
+
+    Args:
+        access_token: Meta system user access token
+        api_version: Meta API version
+
+    Returns:
+        MetaAPIClient: Shared client instance
+    """
+    return MetaAPIClient(access_token=access_token, api_version=api_version)
@@ -64,7 +64,12 @@ def create_video_ad_creative(
     Raises:
         MetaAPIError: If creation fails
     """
-    # Get video thumbnail URL from Meta
+    # Fetch the thumbnail URL from the API. The client caches these
+    # with a TTL, so repeat creatives for the same video skip the
+    # round-trip. Never derive a /picture URL with the access token in
+    # the query string: image_url is persisted in the creative object
+    # and echoed back to anyone who reads it, which would leak the
+    # token and break the creative on rotation.
     thumbnail_url = client.get_video_thumbnail(video_id)
 
     creative_params = {
@@ -87,8 +92,8 @@ def create_video_ad_creative(
         }
     }
 
+    logger.info(f"Creating video creative for video {video_id}")
     try:
-        logger.info(f"Creating video creative for video {video_id}")
         creative_data = client.create_creative(account_id, creative_params)
         creative_id = creative_data.get('id')
 
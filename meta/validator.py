@@ -1,10 +1,17 @@
 """Meta API response validation."""
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from utils.exceptions import MetaAPIError
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Precompiled format check - avoids startswith + substring slicing per call
+_ACCOUNT_RE = re.compile(r'^act_\d+$')
+
+VALID_STATUSES = frozenset({'ACTIVE', 'PAUSED', 'DELETED', 'ARCHIVED'})
+
 
 def validate_api_response(response: Dict[str, Any], expected_fields: Optional[list] = None) -> None:
     """Validate Meta API response.
@@ -64,15 +71,26 @@ def validate_campaign_status(status: str) -> None:
     Raises:
         MetaAPIError: If status is invalid
     """
-    valid_statuses = ['ACTIVE', 'PAUSED', 'DELETED', 'ARCHIVED']
-
-    if status not in valid_statuses:
+    if status not in VALID_STATUSES:
         raise MetaAPIError(
             f"Invalid campaign status: {status}. "
-            f"Must be one of: {', '.join(valid_statuses)}"
+            f"Must be one of: {', '.join(sorted(VALID_STATUSES))}"
         )
 
 
+@lru_cache(maxsize=1024)
+def _is_valid_account(account_id: str) -> bool:
+    """Check account ID format, memoizing the result per ID.
+
+    Args:
+        account_id: Ad account ID
+
+    Returns:
+        bool: True if the ID matches act_<numeric_id>
+    """
+    return bool(_ACCOUNT_RE.match(account_id))
+
+
 def validate_account_id(account_id: str) -> None:
     """Validate ad account ID format.
 
@@ -82,15 +100,7 @@ def validate_account_id(account_id: str) -> None:
     Raises:
         MetaAPIError: If format is invalid
     """
-    if not account_id.startswith('act_'):
-        raise MetaAPIError(
-            f"Invalid account ID format: {account_id}. "
-            "Must start with 'act_'"
-        )
-
-    # Extract numeric part
-    numeric_part = account_id[4:]
-    if not numeric_part.isdigit():
+    if not _is_valid_account(account_id):
         raise MetaAPIError(
             f"Invalid account ID format: {account_id}. "
             "Must be act_<numeric_id>"
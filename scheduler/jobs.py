@@ -1,18 +1,36 @@
 """Job execution functions for scheduled campaign activation."""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
-from meta.client import MetaAPIClient
+from meta.client import get_meta_client
 from meta.campaign import sync_campaign_from_meta
-from storage.file_store import FileStore
+from storage.file_store import get_file_store
 from config.loader import settings
 from utils.logger import setup_logger
 from utils.exceptions import MetaAPIError
 
 logger = setup_logger(__name__)
 
-# Initialize storage
-file_store = FileStore(data_dir=settings.data_dir)
+# Same store instance as the API routes - a private FileStore here
+# would have its own cache and could overwrite route-side writes (and
+# vice versa) within the cache TTL window
+file_store = get_file_store(settings.data_dir)
+
+
+def _mark_schedule_failed(schedule_key: str, error: Exception):
+    """Record a failed activation on the schedule entry.
+
+    Args:
+        schedule_key: Schedule job ID
+        error: Exception that caused the failure
+    """
+    file_store.update_schedule(schedule_key, {
+        'status': 'failed',
+        'executed_at': datetime.now(timezone.utc).isoformat(),
+        'result': 'failed',
+        'error': str(error)
+    })
+    logger.error("Marked schedule %s as failed", schedule_key)
 
 
 def activate_campaign_job(campaign_id: str, meta_campaign_id: str):
@@ -27,75 +45,55 @@ def activate_campaign_job(campaign_id: str, meta_campaign_id: str):
     Raises:
         MetaAPIError: If activation fails
     """
-    logger.info(f"Executing activation job for campaign {campaign_id} (Meta ID: {meta_campaign_id})")
+    logger.info("Executing activation job for campaign %s (Meta ID: %s)", campaign_id, meta_campaign_id)
+
+    # O(1) reverse-index lookup instead of scanning every schedule
+    schedule_key = file_store.get_pending_job_id(campaign_id)
 
     try:
-        # Load schedules
-        schedules = file_store.load('schedules.json')
-        schedule_key = None
-
-        # Find schedule entry for this campaign
-        for key, schedule in schedules.items():
-            if schedule.get('campaign_id') == campaign_id:
-                schedule_key = key
-                break
-
-        # Initialize Meta API client
-        client = MetaAPIClient(
-            access_token=settings.meta_access_token,
-            api_version="v22.0"
-        )
+        # Shared client - reuses the warm connection pool across job fires
+        client = get_meta_client(settings.meta_access_token)
 
         # Update campaign status to ACTIVE
-        logger.info(f"Updating campaign {meta_campaign_id} status to ACTIVE")
+        logger.info("Updating campaign %s status to ACTIVE", meta_campaign_id)
         client.update_campaign_status(meta_campaign_id, 'ACTIVE')
 
         # Sync to verify activation
-        logger.info(f"Syncing campaign {meta_campaign_id} to verify activation")
+        logger.info("Syncing campaign %s to verify activation", meta_campaign_id)
         meta_data = sync_campaign_from_meta(client, meta_campaign_id)
 
-        # Update campaigns.json
-        campaigns = file_store.load('campaigns.json')
-        if campaign_id in campaigns:
-            campaigns[campaign_id]['status'] = meta_data.get('status', 'ACTIVE')
-            campaigns[campaign_id]['activated_at'] = datetime.utcnow().isoformat()
-            campaigns[campaign_id]['last_synced'] = datetime.utcnow().isoformat()
-            file_store.save('campaigns.json', campaigns)
-            logger.info(f"Updated campaign {campaign_id} status in campaigns.json")
-
-        # Update schedules.json
-        if schedule_key and schedule_key in schedules:
-            schedules[schedule_key]['status'] = 'completed'
-            schedules[schedule_key]['executed_at'] = datetime.utcnow().isoformat()
-            schedules[schedule_key]['result'] = 'success'
-            file_store.save('schedules.json', schedules)
-            logger.info(f"Marked schedule {schedule_key} as completed")
-
-        logger.info(f"Campaign {campaign_id} activated successfully")
+        # One timestamp per job - every field written below shares it
+        now_iso = datetime.now(timezone.utc).isoformat()
 
-    except MetaAPIError as e:
-        logger.error(f"Meta API error during activation: {e}")
+        # Record campaign status and schedule outcome in one
+        # transaction so the job does a single fsync'd write pass
+        with file_store.transaction():
+            campaigns = file_store.load('campaigns.json')
+            if campaign_id in campaigns:
+                campaigns[campaign_id]['status'] = meta_data.get('status', 'ACTIVE')
+                campaigns[campaign_id]['activated_at'] = now_iso
+                campaigns[campaign_id]['last_synced'] = now_iso
+                file_store.save('campaigns.json', campaigns)
 
-        # Mark job as failed in schedules.json
-        if schedule_key and schedule_key in schedules:
-            schedules[schedule_key]['status'] = 'failed'
-            schedules[schedule_key]['executed_at'] = datetime.utcnow().isoformat()
-            schedules[schedule_key]['result'] = 'failed'
-            schedules[schedule_key]['error'] = str(e)
-            file_store.save('schedules.json', schedules)
-            logger.error(f"Marked schedule {schedule_key} as failed")
+            schedules = file_store.load('schedules.json')
+            if schedule_key and schedule_key in schedules:
+                schedules[schedule_key]['status'] = 'completed'
+                schedules[schedule_key]['executed_at'] = now_iso
+                schedules[schedule_key]['result'] = 'success'
+                file_store.save('schedules.json', schedules)
 
-        raise
+        logger.info("Recorded activation of campaign %s", campaign_id)
 
-    except Exception as e:
-        logger.exception(f"Unexpected error during activation: {e}")
+        logger.info("Campaign %s activated successfully", campaign_id)
 
-        # Mark job as failed
-        if schedule_key and schedule_key in schedules:
-            schedules[schedule_key]['status'] = 'failed'
-            schedules[schedule_key]['executed_at'] = datetime.utcnow().isoformat()
-            schedules[schedule_key]['result'] = 'failed'
-            schedules[schedule_key]['error'] = str(e)
-            file_store.save('schedules.json', schedules)
+    except MetaAPIError as e:
+        logger.error("Meta API error during activation: %s", e)
+        if schedule_key:
+            _mark_schedule_failed(schedule_key, e)
+        raise
 
+    except Exception as e:
+        logger.exception("Unexpected error during activation: %s", e)
+        if schedule_key:
+            _mark_schedule_failed(schedule_key, e)
         raise
@@ -1,7 +1,5 @@
 """APScheduler manager for campaign activation scheduling."""
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.executors.pool import ThreadPoolExecutor
+import threading
 from datetime import datetime
 from pathlib import Path
 import pytz
@@ -16,12 +14,20 @@ SINGAPORE_TZ = pytz.timezone('Asia/Singapore')
 class SchedulerManager:
     """Manages APScheduler for campaign activation jobs."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", max_workers: int = 32):
         """Initialize scheduler manager.
 
         Args:
             data_dir: Directory for job database
+            max_workers: Thread pool size for concurrent job execution
         """
+        # Lazy imports: apscheduler pulls in sqlalchemy/tzlocal, which
+        # costs ~100ms+ at import time. Deferring to construction keeps
+        # processes that never build a scheduler (CLI scripts) fast.
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        from apscheduler.executors.pool import ThreadPoolExecutor
+
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -30,15 +36,19 @@ class SchedulerManager:
             'default': SQLAlchemyJobStore(url=f'sqlite:///{self.data_dir}/jobs.db')
         }
 
-        # Configure executors
+        # Configure executors - activation jobs are network-bound, so a
+        # wider pool keeps a wave of same-minute activations from
+        # serializing behind a handful of workers
         executors = {
-            'default': ThreadPoolExecutor(10)
+            'default': ThreadPoolExecutor(max_workers)
         }
 
-        # Job defaults
+        # Job defaults - misfire_grace_time keeps bunched-up jobs
+        # running (up to 5 min late) instead of being silently skipped
         job_defaults = {
             'coalesce': False,
-            'max_instances': 1
+            'max_instances': 1,
+            'misfire_grace_time': 300
         }
 
         # Initialize scheduler
@@ -139,10 +149,14 @@ class SchedulerManager:
 
 # Global scheduler instance
 _scheduler_manager = None
+_scheduler_lock = threading.Lock()
 
 def get_scheduler_manager(data_dir: str = "data") -> SchedulerManager:
     """Get singleton scheduler manager instance.
 
+    Thread-safe: concurrent callers during startup get the same
+    instance instead of racing to construct two schedulers.
+
     Args:
         data_dir: Directory for job database
 
@@ -151,5 +165,7 @@ def get_scheduler_manager(data_dir: str = "data") -> SchedulerManager:
     """
     global _scheduler_manager
     if _scheduler_manager is None:
-        _scheduler_manager = SchedulerManager(data_dir=data_dir)
+        with _scheduler_lock:
+            if _scheduler_manager is None:
+                _scheduler_manager = SchedulerManager(data_dir=data_dir)
     return _scheduler_manager
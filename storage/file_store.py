@@ -1,26 +1,67 @@
 """File-based storage implementation using JSON."""
-import json
+import copy
+import orjson
 import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple
 from utils.logger import setup_logger
 from utils.exceptions import StorageError
 
 logger = setup_logger(__name__)
 
+# How long a cached file is trusted without re-stat'ing it (seconds).
+# Only safe because get_file_store() hands every caller the same
+# instance per data dir - with a single cache there is no second store
+# whose stale entry could overwrite a fresher write.
+CACHE_TTL = float(os.environ.get('FILE_STORE_CACHE_TTL', '10'))
+
+# On Linux, write temp data through an unlinked O_TMPFILE and only link
+# it into the directory once fully written - a crash mid-write leaves
+# no stale .tmp entry behind. Cleared at runtime if the filesystem (or
+# a restricted /proc) rejects the pattern, so we only probe once.
+_USE_O_TMPFILE = sys.platform == 'linux' and hasattr(os, 'O_TMPFILE')
+
 
 class FileStore:
     """File-based storage for campaign, account, and schedule data."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", pretty: bool = False):
         """Initialize file store.
 
         Args:
             data_dir: Directory for data files
+            pretty: Indent saved JSON (costs CPU and bytes; the files
+                are machine-read, so defaults to compact output)
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self._dump_option = orjson.OPT_INDENT_2 if pretty else 0
+
+        # In-memory cache: filename -> (mtime_ns, size, data, deadline).
+        # Within CACHE_TTL of the last verification the cached dict is
+        # returned without touching the filesystem; after that a stat
+        # re-validates against mtime/size. Updated in place on every
+        # save (write-through).
+        self._cache: Dict[str, tuple] = {}
+
+        # While a transaction() is open, save() calls from that thread
+        # stage here instead of writing; the buffer is published as one
+        # batch at exit. Thread-local because the shared store runs on
+        # the scheduler pool and to_thread workers concurrently - one
+        # thread's transaction must never capture (or, on abort,
+        # discard) saves made by another thread.
+        self._txn = threading.local()
+
+        # Serializes the temp-write/rename/cache-update sequence:
+        # concurrent writers would otherwise collide on the shared
+        # .tmp path. RLock because saving schedules.json re-enters
+        # save() for the reverse index.
+        self._write_lock = threading.RLock()
 
         # Initialize empty data files if they don't exist
         self._ensure_file_exists('accounts.json')
@@ -35,62 +76,369 @@ class FileStore:
         """
         file_path = self.data_dir / filename
         if not file_path.exists():
-            with open(file_path, 'w') as f:
-                json.dump({}, f, indent=2)
-            logger.info(f"Created data file: {filename}")
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps({}))
+            logger.info("Created data file: %s", filename)
 
-    def load(self, filename: str) -> Dict[str, Any]:
-        """Load JSON file.
+    def _load_shared(self, filename: str) -> Dict[str, Any]:
+        """Load a data file, returning the cached dict itself.
+
+        Internal read-only fast path: callers must never mutate the
+        result, since it is the live cache entry. External callers go
+        through load(), which hands out a copy.
 
         Args:
             filename: Name of file to load
 
         Returns:
-            dict: Loaded data
+            dict: Loaded data (shared, do not mutate)
 
         Raises:
             StorageError: If file cannot be loaded
         """
         file_path = self.data_dir / filename
         try:
-            if not file_path.exists():
+            # Within the TTL window, trust the cache without a stat
+            now = time.monotonic()
+            cached = self._cache.get(filename)
+            if cached and now < cached[3]:
+                return cached[2]
+
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return {}
 
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            logger.debug(f"Loaded {filename}: {len(data)} entries")
+            # Serve from cache if the file hasn't changed on disk
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._cache[filename] = (cached[0], cached[1], cached[2], now + CACHE_TTL)
+                return cached[2]
+
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+            self._cache[filename] = (st.st_mtime_ns, st.st_size, data, now + CACHE_TTL)
+            logger.debug("Loaded %s: %d entries", filename, len(data))
             return data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise StorageError(f"Invalid JSON in {filename}: {e}")
         except Exception as e:
             raise StorageError(f"Failed to load {filename}: {e}")
 
-    def save(self, filename: str, data: Dict[str, Any]):
+    def load(self, filename: str) -> Dict[str, Any]:
+        """Load JSON file.
+
+        The returned dict is the caller's own copy - mutating it does
+        not touch the cache, so a mutation followed by a failed save()
+        cannot leave the cache poisoned with unwritten state, and a
+        dict being edited on the event loop can't be concurrently
+        serialized out of the cache by a worker thread.
+
+        Args:
+            filename: Name of file to load
+
+        Returns:
+            dict: Loaded data (copy, safe to mutate)
+
+        Raises:
+            StorageError: If file cannot be loaded
+        """
+        return copy.deepcopy(self._load_shared(filename))
+
+    def contains(self, filename: str, key: str) -> bool:
+        """Check whether a key exists in a data file.
+
+        Served from the in-memory cache when fresh, so unknown-ID
+        requests can be rejected without re-reading the file.
+
+        Args:
+            filename: Name of data file
+            key: Top-level key to check
+
+        Returns:
+            bool: True if the key exists
+        """
+        return key in self._load_shared(filename)
+
+    def _write_temp(self, temp_path: Path, data: Dict[str, Any],
+                    durability: Literal['none', 'fsync', 'fsync_dir'] = 'fsync'):
+        """Serialize data and write it to a temp file in one pass.
+
+        orjson emits bytes in a single allocation, and the fd-based
+        write avoids the TextIOWrapper/BufferedWriter layers and the
+        intermediate str copy. Unless durability is 'none', the temp
+        file is fsync'd so the subsequent rename publishes
+        fully-written content.
+
+        Args:
+            temp_path: Temp file path to write
+            data: Data to serialize
+            durability: See save()
+        """
+        payload = orjson.dumps(data, option=self._dump_option, default=str)
+
+        global _USE_O_TMPFILE
+        if _USE_O_TMPFILE:
+            try:
+                fd = os.open(str(self.data_dir), os.O_TMPFILE | os.O_WRONLY, 0o644)
+                try:
+                    os.write(fd, payload)
+                    if durability != 'none':
+                        os.fsync(fd)
+                    # Publish the anonymous file under the temp name;
+                    # until this point nothing is visible on disk
+                    if temp_path.exists():
+                        temp_path.unlink()
+                    os.link(f'/proc/self/fd/{fd}', str(temp_path),
+                            follow_symlinks=True)
+                finally:
+                    os.close(fd)
+                return
+            except OSError:
+                # Filesystem or /proc doesn't support the pattern -
+                # disable it for the rest of the process
+                _USE_O_TMPFILE = False
+
+        fd = os.open(str(temp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            if durability != 'none':
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _sync_dir(self):
+        """fsync the data directory so a completed rename survives a
+        crash. No-op on platforms without O_DIRECTORY (Windows)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        dir_fd = os.open(str(self.data_dir), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def load_bytes(self, filename: str) -> bytes:
+        """Load raw file bytes without parsing.
+
+        Useful with the pre-compiled TypeAdapters in storage.models,
+        whose validate_json parses and validates in one pass.
+
+        Args:
+            filename: Name of file to load
+
+        Returns:
+            bytes: Raw file contents (b'{}' if file doesn't exist)
+
+        Raises:
+            StorageError: If file cannot be read
+        """
+        file_path = self.data_dir / filename
+        try:
+            if not file_path.exists():
+                return b'{}'
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            raise StorageError(f"Failed to load {filename}: {e}")
+
+    def load_validated(self, filename: str) -> Dict[str, Any]:
+        """Load a data file validated through its pre-compiled adapter.
+
+        The raw bytes go straight into TypeAdapter.validate_json, so
+        pydantic-core parses and validates in one pass with no
+        intermediate dict materialization.
+
+        Args:
+            filename: One of accounts.json / campaigns.json / schedules.json
+
+        Returns:
+            dict: Mapping of ID -> validated model
+
+        Raises:
+            StorageError: If the file is unknown or fails validation
+        """
+        from storage.models import ACCOUNTS_ADAPTER, CAMPAIGNS_ADAPTER, SCHEDULES_ADAPTER
+        adapters = {
+            'accounts.json': ACCOUNTS_ADAPTER,
+            'campaigns.json': CAMPAIGNS_ADAPTER,
+            'schedules.json': SCHEDULES_ADAPTER,
+        }
+        adapter = adapters.get(filename)
+        if adapter is None:
+            raise StorageError(f"No adapter for {filename}")
+        try:
+            return adapter.validate_json(self.load_bytes(filename))
+        except ValueError as e:
+            raise StorageError(f"Invalid data in {filename}: {e}")
+
+    def save(self, filename: str, data: Dict[str, Any],
+             durability: Literal['none', 'fsync', 'fsync_dir'] = 'fsync'):
         """Save data to JSON file atomically.
 
         Args:
             filename: Name of file to save
             data: Data to save
+            durability: 'none' skips fsync (fastest, a crash may lose
+                the write), 'fsync' (default) syncs the temp file
+                before the rename, 'fsync_dir' additionally syncs the
+                data directory so the rename itself is durable
 
         Raises:
             StorageError: If file cannot be saved
         """
+        # Inside this thread's transaction, just stage the latest data
+        # for the file
+        txn_buffer = getattr(self._txn, 'buffer', None)
+        if txn_buffer is not None:
+            txn_buffer[filename] = data
+            return
+
         file_path = self.data_dir / filename
         temp_path = file_path.with_suffix('.tmp')
 
+        with self._write_lock:
+            try:
+                # Write to temp file
+                self._write_temp(temp_path, data, durability)
+
+                # Atomic rename
+                temp_path.replace(file_path)
+                if durability == 'fsync_dir':
+                    self._sync_dir()
+
+                # Write-through: update cache so the next load skips the
+                # disk. Cache a copy, not the caller's dict - the caller
+                # may keep mutating its reference after save() returns.
+                st = os.stat(file_path)
+                self._cache[filename] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data),
+                                         time.monotonic() + CACHE_TTL)
+                logger.debug("Saved %s: %d entries", filename, len(data))
+
+                # Keep the pending-schedule reverse index in sync
+                if filename == 'schedules.json':
+                    self._rebuild_schedule_index(data)
+            except Exception as e:
+                # Clean up temp file if exists
+                if temp_path.exists():
+                    temp_path.unlink()
+                raise StorageError(f"Failed to save {filename}: {e}")
+
+    def save_many(self, files: Dict[str, Dict[str, Any]]):
+        """Save multiple data files as a single batch.
+
+        All temp files are written first, then published together, so a
+        failure while serializing leaves every file untouched.
+
+        Args:
+            files: Mapping of filename -> data to save
+
+        Raises:
+            StorageError: If any file cannot be saved
+        """
+        staged = []
+        with self._write_lock:
+            try:
+                for filename, data in files.items():
+                    file_path = self.data_dir / filename
+                    temp_path = file_path.with_suffix('.tmp')
+                    self._write_temp(temp_path, data)
+                    staged.append((filename, file_path, temp_path, data))
+
+                for filename, file_path, temp_path, data in staged:
+                    temp_path.replace(file_path)
+                    st = os.stat(file_path)
+                    self._cache[filename] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data),
+                                             time.monotonic() + CACHE_TTL)
+                    logger.debug("Saved %s: %d entries", filename, len(data))
+
+                if 'schedules.json' in files:
+                    self._rebuild_schedule_index(files['schedules.json'])
+            except Exception as e:
+                for _, _, temp_path, _ in staged:
+                    if temp_path.exists():
+                        temp_path.unlink()
+                raise StorageError(f"Failed to save batch {list(files)}: {e}")
+
+    @contextmanager
+    def transaction(self):
+        """Buffer save() calls and publish them as one batch on exit.
+
+        Inside the block, save() records the latest data per file
+        instead of writing; on clean exit everything is flushed through
+        save_many (one fsync'd write pass, all-or-nothing staging). If
+        the block raises, the buffered writes are discarded.
+
+        The buffer is per-thread: concurrent transactions on other
+        threads (scheduler pool, to_thread workers) proceed
+        independently, and a save() from a thread without an open
+        transaction writes through immediately as usual.
+        """
+        if getattr(self._txn, 'buffer', None) is not None:
+            raise StorageError("Nested transactions are not supported")
+        self._txn.buffer = {}
         try:
-            # Write to temp file
-            with open(temp_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            yield self
+        except Exception:
+            self._txn.buffer = None
+            raise
+        else:
+            buffered = self._txn.buffer
+            self._txn.buffer = None
+            if buffered:
+                self.save_many(buffered)
+
+    def _rebuild_schedule_index(self, schedules: Dict[str, Any]):
+        """Rebuild the campaign_id -> pending job_id reverse index.
+
+        Called on every schedules.json save so lookups by campaign stay
+        O(1) instead of scanning all schedules.
 
-            # Atomic rename
-            temp_path.replace(file_path)
-            logger.debug(f"Saved {filename}: {len(data)} entries")
-        except Exception as e:
-            # Clean up temp file if exists
-            if temp_path.exists():
-                temp_path.unlink()
-            raise StorageError(f"Failed to save {filename}: {e}")
+        Args:
+            schedules: Full schedules dict just saved
+        """
+        index = {
+            schedule['campaign_id']: job_id
+            for job_id, schedule in schedules.items()
+            if schedule.get('status') == 'pending' and schedule.get('campaign_id')
+        }
+        self.save('schedules_index.json', index)
+
+    def get_pending_job_id(self, campaign_id: str) -> Optional[str]:
+        """Get the pending schedule job ID for a campaign.
+
+        Args:
+            campaign_id: Internal campaign ID
+
+        Returns:
+            str or None: Job ID of the pending schedule if one exists
+        """
+        index_path = self.data_dir / 'schedules_index.json'
+        if not index_path.exists():
+            # Data dir predates the index feature - build the file
+            # once. An existing-but-empty index just means no pending
+            # schedules (the steady state) and must not trigger a
+            # rebuild write on every read.
+            self._rebuild_schedule_index(self._load_shared('schedules.json'))
+        index = self._load_shared('schedules_index.json')
+        return index.get(campaign_id)
+
+    def _mutate(self, filename: str, fn):
+        """Apply a mutation to a data file and persist it once.
+
+        The dict comes from the in-memory cache when fresh, so the
+        read side of a read-modify-write is a lookup rather than a
+        file parse; only the save serializes.
+
+        Args:
+            filename: Name of data file
+            fn: Callable applied to the loaded dict in place
+
+        Raises:
+            StorageError: If the mutation or save fails
+        """
+        data = self.load(filename)
+        fn(data)
+        self.save(filename, data)
 
     # Account operations
     def get_account(self, account_id: str) -> Optional[Dict[str, Any]]:
@@ -112,10 +460,8 @@ class FileStore:
             account_id: Internal account ID
             account_data: Account configuration data
         """
-        accounts = self.load('accounts.json')
-        accounts[account_id] = account_data
-        self.save('accounts.json', accounts)
-        logger.info(f"Added/updated account: {account_id}")
+        self._mutate('accounts.json', lambda accounts: accounts.__setitem__(account_id, account_data))
+        logger.info("Added/updated account: %s", account_id)
 
     # Campaign operations
     def get_campaign(self, campaign_id: str) -> Optional[Dict[str, Any]]:
@@ -140,14 +486,13 @@ class FileStore:
         Raises:
             StorageError: If campaign already exists
         """
-        campaigns = self.load('campaigns.json')
-
-        if campaign_id in campaigns:
-            raise StorageError(f"Campaign {campaign_id} already exists")
+        def _add(campaigns):
+            if campaign_id in campaigns:
+                raise StorageError(f"Campaign {campaign_id} already exists")
+            campaigns[campaign_id] = campaign_data
 
-        campaigns[campaign_id] = campaign_data
-        self.save('campaigns.json', campaigns)
-        logger.info(f"Added campaign: {campaign_id}")
+        self._mutate('campaigns.json', _add)
+        logger.info("Added campaign: %s", campaign_id)
 
     def update_campaign(self, campaign_id: str, updates: Dict[str, Any]):
         """Update campaign fields.
@@ -159,17 +504,18 @@ class FileStore:
         Raises:
             StorageError: If campaign not found
         """
-        campaigns = self.load('campaigns.json')
-
-        if campaign_id not in campaigns:
-            raise StorageError(f"Campaign {campaign_id} not found")
-
-        # Update fields
-        campaigns[campaign_id].update(updates)
-        campaigns[campaign_id]['last_updated'] = datetime.utcnow().isoformat() + 'Z'
-
-        self.save('campaigns.json', campaigns)
-        logger.info(f"Updated campaign: {campaign_id}")
+        def _update(campaigns):
+            if campaign_id not in campaigns:
+                raise StorageError(f"Campaign {campaign_id} not found")
+            campaigns[campaign_id].update(updates)
+            # Single C call producing the final string; also avoids the
+            # deprecated naive utcnow()
+            campaigns[campaign_id]['last_updated'] = time.strftime(
+                '%Y-%m-%dT%H:%M:%SZ', time.gmtime()
+            )
+
+        self._mutate('campaigns.json', _update)
+        logger.info("Updated campaign: %s", campaign_id)
 
     def list_campaigns(self) -> Dict[str, Any]:
         """List all campaigns.
@@ -179,6 +525,18 @@ class FileStore:
         """
         return self.load('campaigns.json')
 
+    def iter_campaigns(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate campaigns lazily as (campaign_id, data) pairs.
+
+        Backed by the cached dict, so scans that filter or early-exit
+        avoid copying the full mapping per call. Read-only: callers
+        must not mutate the yielded dicts.
+
+        Yields:
+            tuple: (campaign_id, campaign data)
+        """
+        yield from self._load_shared('campaigns.json').items()
+
     # Schedule operations
     def get_schedule(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get schedule data.
@@ -199,10 +557,8 @@ class FileStore:
             job_id: Job ID
             schedule_data: Schedule data
         """
-        schedules = self.load('schedules.json')
-        schedules[job_id] = schedule_data
-        self.save('schedules.json', schedules)
-        logger.info(f"Added schedule: {job_id}")
+        self._mutate('schedules.json', lambda schedules: schedules.__setitem__(job_id, schedule_data))
+        logger.info("Added schedule: %s", job_id)
 
     def update_schedule(self, job_id: str, updates: Dict[str, Any]):
         """Update schedule fields.
@@ -214,14 +570,13 @@ class FileStore:
         Raises:
             StorageError: If schedule not found
         """
-        schedules = self.load('schedules.json')
-
-        if job_id not in schedules:
-            raise StorageError(f"Schedule {job_id} not found")
+        def _update(schedules):
+            if job_id not in schedules:
+                raise StorageError(f"Schedule {job_id} not found")
+            schedules[job_id].update(updates)
 
-        schedules[job_id].update(updates)
-        self.save('schedules.json', schedules)
-        logger.info(f"Updated schedule: {job_id}")
+        self._mutate('schedules.json', _update)
+        logger.info("Updated schedule: %s", job_id)
 
     def delete_schedule(self, job_id: str):
         """Delete schedule.
@@ -232,14 +587,23 @@ class FileStore:
         Raises:
             StorageError: If schedule not found
         """
-        schedules = self.load('schedules.json')
+        def _delete(schedules):
+            if job_id not in schedules:
+                raise StorageError(f"Schedule {job_id} not found")
+            del schedules[job_id]
+
+        self._mutate('schedules.json', _delete)
+        logger.info("Deleted schedule: %s", job_id)
 
-        if job_id not in schedules:
-            raise StorageError(f"Schedule {job_id} not found")
+    def iter_schedules(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate schedules lazily as (job_id, data) pairs.
 
-        del schedules[job_id]
-        self.save('schedules.json', schedules)
-        logger.info(f"Deleted schedule: {job_id}")
+        Read-only: callers must not mutate the yielded dicts.
+
+        Yields:
+            tuple: (job_id, schedule data)
+        """
+        yield from self._load_shared('schedules.json').items()
 
     def list_schedules(self) -> Dict[str, Any]:
         """List all schedules.
@@ -248,3 +612,21 @@ class FileStore:
             dict: All schedules
         """
         return self.load('schedules.json')
+
+
+@lru_cache(maxsize=4)
+def get_file_store(data_dir: str = "data") -> FileStore:
+    """Shared FileStore instance for a data directory.
+
+    Every part of the process (routes, scheduler jobs) must go through
+    this so they share one in-memory cache - two stores with
+    independent caches could each trust a TTL-fresh entry and silently
+    overwrite the other's writes.
+
+    Args:
+        data_dir: Directory for data files
+
+    Returns:
+        FileStore: Cached instance for that directory
+    """
+    return FileStore(data_dir=data_dir)
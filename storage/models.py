@@ -1,10 +1,11 @@
 """Data models for storage layer."""
+from dataclasses import dataclass
 from typing import Optional, Dict
-from datetime import datetime
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 
-class AccountConfig(BaseModel):
+@dataclass(frozen=True)
+class AccountConfig:
     """Client ad account configuration."""
     account_id: str
     client_name: str
@@ -16,7 +17,8 @@ class AccountConfig(BaseModel):
     active: bool = True
 
 
-class MetaIDs(BaseModel):
+@dataclass(frozen=True)
+class MetaIDs:
     """Meta object IDs for a campaign."""
     campaign_id: str
     adset_id: str
@@ -25,22 +27,25 @@ class MetaIDs(BaseModel):
     video_id: str
 
 
-class CampaignData(BaseModel):
-    """Campaign tracking data."""
-    internal_id: str
-    client_account_id: str
-    name: str
+@dataclass(frozen=True)
+class CampaignData:
+    """Campaign tracking data as stored in campaigns.json."""
+    campaign_id: str
     status: str
-    daily_budget: int
+    created_at: str
     meta_ids: MetaIDs
+    account_id: str
+    client_account_id: str
+    campaign_name: str
     config_path: str
-    created_at: str
+    daily_budget: Optional[int] = None
     activated_at: Optional[str] = None
-    last_updated: str
+    last_updated: Optional[str] = None
     last_synced: Optional[str] = None
 
 
-class ScheduleData(BaseModel):
+@dataclass(frozen=True)
+class ScheduleData:
     """Schedule tracking data."""
     job_id: str
     campaign_id: str
@@ -50,3 +55,12 @@ class ScheduleData(BaseModel):
     created_at: str
     executed_at: Optional[str] = None
     error: Optional[str] = None
+
+
+# Pre-compiled adapters for the persistent JSON files. Built once at
+# import so callers can validate raw file bytes directly (validate_json
+# parses and validates in one pass) instead of paying per-call schema
+# construction on top of json.loads.
+ACCOUNTS_ADAPTER = TypeAdapter(Dict[str, AccountConfig])
+CAMPAIGNS_ADAPTER = TypeAdapter(Dict[str, CampaignData])
+SCHEDULES_ADAPTER = TypeAdapter(Dict[str, ScheduleData])
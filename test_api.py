@@ -2,12 +2,19 @@
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/v1"
 
+# Shared session so the whole sweep reuses pooled keep-alive
+# connections instead of handshaking per request
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
 
 def print_header(text):
     """Print a formatted header."""
@@ -26,18 +33,16 @@ def print_response(response):
         print(f"Response: {response.text}")
 
 
-def test_health():
+def test_health(response):
     """Test health check endpoint."""
     print_header("Test 1: Health Check")
-    response = requests.get(f"{BASE_URL}/health")
     print_response(response)
     return response.status_code == 200
 
 
-def test_root():
+def test_root(response):
     """Test root endpoint."""
     print_header("Test 2: Root Endpoint")
-    response = requests.get(f"{BASE_URL}/")
     print_response(response)
     return response.status_code == 200
 
@@ -58,7 +63,7 @@ def test_create_account():
     print(f"Request: POST {API_BASE}/accounts")
     print(f"Body:\n{json.dumps(account_data, indent=2)}")
 
-    response = requests.post(f"{API_BASE}/accounts", json=account_data)
+    response = SESSION.post(f"{API_BASE}/accounts", json=account_data)
     print_response(response)
 
     if response.status_code == 409:
@@ -68,12 +73,9 @@ def test_create_account():
     return response.status_code == 201
 
 
-def test_get_account():
+def test_get_account(response):
     """Test getting account details."""
     print_header("Test 4: Get Account")
-
-    account_id = "acct_example"  # Change to your account ID
-    response = requests.get(f"{API_BASE}/accounts/{account_id}")
     print_response(response)
 
     return response.status_code == 200
@@ -94,7 +96,7 @@ def test_create_campaign():
 
     input("\nPress ENTER to continue or Ctrl+C to cancel...")
 
-    response = requests.post(f"{API_BASE}/campaigns", json=campaign_data)
+    response = SESSION.post(f"{API_BASE}/campaigns", json=campaign_data)
     print_response(response)
 
     if response.status_code == 201:
@@ -118,7 +120,7 @@ def test_get_campaign_status(campaign_id):
     """Test getting campaign status."""
     print_header("Test 6: Get Campaign Status")
 
-    response = requests.get(f"{API_BASE}/campaigns/{campaign_id}")
+    response = SESSION.get(f"{API_BASE}/campaigns/{campaign_id}")
     print_response(response)
 
     return response.status_code == 200
@@ -128,7 +130,7 @@ def test_sync_campaign(campaign_id):
     """Test syncing campaign from Meta."""
     print_header("Test 7: Sync Campaign")
 
-    response = requests.post(f"{API_BASE}/campaigns/{campaign_id}/sync")
+    response = SESSION.post(f"{API_BASE}/campaigns/{campaign_id}/sync")
     print_response(response)
 
     return response.status_code == 200
@@ -145,7 +147,7 @@ def test_activate_campaign(campaign_id):
         print("Skipped activation test")
         return True
 
-    response = requests.post(f"{API_BASE}/campaigns/{campaign_id}/activate")
+    response = SESSION.post(f"{API_BASE}/campaigns/{campaign_id}/activate")
     print_response(response)
 
     if response.status_code == 200:
@@ -165,7 +167,7 @@ def main():
 
     # Check if server is running
     try:
-        requests.get(BASE_URL, timeout=2)
+        SESSION.get(BASE_URL, timeout=2)
     except requests.exceptions.ConnectionError:
         print("\n❌ ERROR: API server is not running!")
         print("\nStart the server first:")
@@ -176,10 +178,17 @@ def main():
     results = []
     campaign_id = None
 
-    # Run basic tests
-    results.append(("Health Check", test_health()))
-    results.append(("Root Endpoint", test_root()))
-    results.append(("Get Account", test_get_account()))
+    # The basic checks are independent - fire the requests
+    # concurrently, then print/score them in order
+    account_id = "acct_example"  # Change to your account ID
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        health_future = pool.submit(SESSION.get, f"{BASE_URL}/health")
+        root_future = pool.submit(SESSION.get, f"{BASE_URL}/")
+        account_future = pool.submit(SESSION.get, f"{API_BASE}/accounts/{account_id}")
+
+    results.append(("Health Check", test_health(health_future.result())))
+    results.append(("Root Endpoint", test_root(root_future.result())))
+    results.append(("Get Account", test_get_account(account_future.result())))
 
     # Ask before creating campaign
     print("\n" + "=" * 70)
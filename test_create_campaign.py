@@ -2,15 +2,19 @@
 """Simple script to test campaign creation."""
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 url = "http://localhost:8000/api/v1/campaigns"
 data = {"config_path": "configs/example_campaign.yaml"}
 
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
 print("Creating campaign...")
 print(f"Request: POST {url}")
 print(f"Body: {json.dumps(data, indent=2)}\n")
 
-response = requests.post(url, json=data)
+response = SESSION.post(url, json=data)
 
 print(f"Status Code: {response.status_code}")
 print(f"Response:\n{json.dumps(response.json(), indent=2)}")
@@ -3,7 +3,18 @@
 
 class MetaAPIError(Exception):
     """Base exception for Meta API related errors."""
-    pass
+
+    def __init__(self, message, error_code=None, response=None):
+        """Initialize error.
+
+        Args:
+            message: Error description
+            error_code: Meta API error code, if the API returned one
+            response: Original HTTP response, if available
+        """
+        super().__init__(message)
+        self.error_code = error_code
+        self.response = response
 
 
 class VideoUploadError(MetaAPIError):
@@ -0,0 +1,72 @@
+"""Exponential-backoff retry helper for Meta Graph API HTTP calls."""
+import random
+import time
+import requests
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Transient statuses worth retrying: throttling and server-side errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_request(fn, *, max_attempts: int = 8, base: float = 1.0, cap: float = 64.0) -> requests.Response:
+    """Call an HTTP request function with exponential backoff.
+
+    Retries on connection-level failures (requests.RequestException) and
+    on retryable HTTP statuses (429/5xx), sleeping
+    min(cap, base * 2**attempt) plus jitter between attempts. A
+    Retry-After header, when present, overrides the computed delay.
+
+    Args:
+        fn: Zero-argument callable returning a requests.Response
+        max_attempts: Total attempts before giving up
+        base: Initial backoff in seconds
+        cap: Maximum backoff in seconds
+
+    Returns:
+        requests.Response: The last response received
+
+    Raises:
+        requests.exceptions.RequestException: If every attempt failed at
+            the connection level
+    """
+    last_exc = None
+    response = None
+
+    for attempt in range(max_attempts):
+        try:
+            response = fn()
+            last_exc = None
+        except requests.exceptions.RequestException as e:
+            last_exc = e
+            response = None
+
+        if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+            return response
+
+        if attempt == max_attempts - 1:
+            break
+
+        delay = min(cap, base * (2 ** attempt)) + random.uniform(0, 1)
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    pass
+            logger.warning(
+                f"HTTP {response.status_code} (attempt {attempt + 1}/{max_attempts}), "
+                f"retrying in {delay:.1f}s"
+            )
+        else:
+            logger.warning(
+                f"Request failed: {last_exc} (attempt {attempt + 1}/{max_attempts}), "
+                f"retrying in {delay:.1f}s"
+            )
+        time.sleep(delay)
+
+    if last_exc is not None:
+        raise last_exc
+    return response
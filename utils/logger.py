@@ -1,9 +1,22 @@
 """Logging configuration for the application."""
 import logging
 import sys
+from functools import lru_cache
 from config.loader import settings
 
+# Resolved once at import - every logger shares the same level,
+# formatter and handler instead of rebuilding them per module
+_LEVEL = getattr(logging, settings.log_level.upper(), logging.INFO)
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setLevel(_LEVEL)
+_HANDLER.setFormatter(_FORMATTER)
 
+
+@lru_cache(maxsize=None)
 def setup_logger(name: str = __name__) -> logging.Logger:
     """Set up logger with consistent formatting.
 
@@ -17,22 +30,7 @@ def setup_logger(name: str = __name__) -> logging.Logger:
 
     # Only configure if not already configured
     if not logger.handlers:
-        # Set level from settings
-        log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-        logger.setLevel(log_level)
-
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(log_level)
-
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-
-        # Add handler to logger
-        logger.addHandler(handler)
+        logger.setLevel(_LEVEL)
+        logger.addHandler(_HANDLER)
 
     return logger